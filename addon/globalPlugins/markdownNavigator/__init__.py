@@ -8,6 +8,9 @@ import controlTypes
 
 from .navigator import MarkdownEditorOverlay
 
+#: Window classes of editors that get the overlay even when their role is not EDITABLETEXT.
+EDITOR_WINDOW_CLASSES = frozenset({"Scintilla", "RichEditD2DPT", "AkelEditW"})
+
 
 class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 	def chooseNVDAObjectOverlayClasses(self, obj, clsList):
@@ -16,10 +19,5 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		# Windows 11 Notepad uses RichEditD2DPT class
 		# Use getattr to safely access windowClassName, especially on Secure Desktops where it might be missing
 		windowClassName = getattr(obj, "windowClassName", "")
-		if (
-			obj.role == controlTypes.Role.EDITABLETEXT
-			or windowClassName == "Scintilla"
-			or windowClassName == "RichEditD2DPT"
-			or windowClassName == "AkelEditW"
-		):
+		if obj.role == controlTypes.Role.EDITABLETEXT or windowClassName in EDITOR_WINDOW_CLASSES:
 			clsList.insert(0, MarkdownEditorOverlay)
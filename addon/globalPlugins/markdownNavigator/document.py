@@ -12,15 +12,20 @@ without repeated IPC calls.
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
+from collections.abc import Iterator
 
 import re
 import bisect
+from array import array
+from functools import cached_property
 import textInfos
 from logHandler import log
 from _ctypes import COMError
+from textUtils import WCHAR_ENCODING, getOffsetConverter
 from textInfos.offsets import OffsetsTextInfo
 from appModules.devenv import VsWpfTextViewTextInfo
 from NVDAObjects.IAccessible import IA2TextTextInfo
+from . import patterns
 
 if TYPE_CHECKING:
 	from NVDAObjects import NVDAObject
@@ -28,15 +33,74 @@ if TYPE_CHECKING:
 #: Regex pattern for splitting text into lines.
 NEWLINE_REGEX = re.compile(r"\r?\n|\r")
 
+#: Regex pattern matching characters outside the Basic Multilingual Plane,
+#: which take two UTF-16 code units (a surrogate pair) instead of one.
+ASTRAL_REGEX = re.compile("[\U00010000-\U0010ffff]")
+
+#: Maximum number of line strings kept by FastDocumentManager.getText.
+LINE_CACHE_SIZE = 64
+
+#: Lowercase app names of web browsers, whose documents support flat IA2 offset injection.
+WEB_APP_NAMES = frozenset({"chrome", "msedge", "firefox", "opera", "brave", "browser"})
+
+
+def _findLineStarts(text: str, separator: str) -> list[int]:
+	"""Return line start offsets for text that uses a single kind of line separator.
+
+	str.find is much faster than the regex engine for a fixed separator,
+	and counting first lets the offsets list be allocated once.
+	"""
+	offsets = [0] * (text.count(separator) + 1)
+	find = text.find
+	step = len(separator)
+	pos = 0
+	for i in range(1, len(offsets)):
+		pos = find(separator, pos) + step
+		offsets[i] = pos
+	return offsets
+
 
 def _splitLines(text: str) -> list[int]:
-	"""Split text into lines using regex and return a list of start offsets for each line."""
+	"""Split text into lines and return a list of start offsets for each line."""
+	crCount = text.count("\r")
+	if not crCount:
+		return _findLineStarts(text, "\n")
+	lfCount = text.count("\n")
+	if not lfCount:
+		return _findLineStarts(text, "\r")
+	if crCount == lfCount == text.count("\r\n"):
+		return _findLineStarts(text, "\r\n")
+	# Mixed line endings: let the regex sort out each separator.
 	offsets = [0]
 	for m in NEWLINE_REGEX.finditer(text):
 		offsets.append(m.end())
 	return offsets
 
 
+def _findAstralPositions(text: str) -> list[int]:
+	"""Return the Python offsets of all astral characters in text, in ascending order.
+
+	Every astral character before a position adds one extra UTF-16 code unit,
+	so this list is enough to map any Python offset to a UTF-16 offset.
+	"""
+	if text.isascii():
+		return []
+	return [m.start() for m in ASTRAL_REGEX.finditer(text)]
+
+
+def _getUtf16Offsets(pyOffsets: array[int], astralPositions: list[int]) -> array[int]:
+	"""Convert Python line start offsets into UTF-16 code unit offsets.
+
+	The table is derived from the astral positions without looking for line breaks again.
+	"""
+	if not astralPositions:
+		# Text within the Basic Multilingual Plane takes one code unit per character,
+		# so the tables are identical.
+		return pyOffsets
+	bisectLeft = bisect.bisect_left
+	return array("i", [offset + bisectLeft(astralPositions, offset) for offset in pyOffsets])
+
+
 def _getParagraphUnit(textInfo: textInfos.TextInfo) -> str:
 	"""Return the appropriate paragraph unit based on the control type."""
 	try:
@@ -58,63 +122,257 @@ class FastDocumentManager:
 	https://github.com/mltony/nvda-indent-nav
 	"""
 
-	def __init__(self, obj: NVDAObject) -> None:
+	def __init__(self, obj: NVDAObject, previous: FastDocumentManager | None = None) -> None:
+		"""Create a manager for obj; the document is loaded on entering it.
+
+		:param previous: A manager that loaded the same object earlier. If the text it loaded is
+			still the document's text, its line tables and match indexes are reused.
+		"""
 		self.obj: NVDAObject = obj
 		self.documentText: str | None = None
-		self.pyOffsets: list[int] = []
-		self.utf16Offsets: list[int] = []
+		self.pyOffsets: array[int] = array("i")
 		self.lineIndex: int = 0
 		self.originalLineIndex: int = 0
 		self.nLines: int = 0
 		self.document: textInfos.TextInfo | None = None
 		self.originalCaret: textInfos.TextInfo | None = None
 		self.initialCaretOffset: int = 0
+		self.isWeb: bool = False
+		self._lineCache: dict[int, str] = {}
+		self._lastFoundLine: int = 0
+		self._matchLines: dict[re.Pattern, list[int]] = {}
+		self._runKeys: dict[re.Pattern, list[int]] = {}
+		self._previous: FastDocumentManager | None = previous
 
 	def __enter__(self) -> FastDocumentManager:
 		"""Enter context manager and preload document text."""
 		try:
 			self.document = self.obj.makeTextInfo(textInfos.POSITION_ALL)
-			self.originalCaret = self.obj.makeTextInfo(textInfos.POSITION_CARET)
 		except (NotImplementedError, LookupError, COMError) as e:
 			raise RuntimeError(f"Cannot obtain document TextInfo: {e}")
-
-		self.originalCaret.collapse()
-		pretext = self.originalCaret.copy()
-		pretext.setEndPoint(self.document, "startToStart")
 		self.documentText = self.document.text
 
-		# Calculate offsets: maintain both Python indices (for regex/slicing)
-		# and UTF-16 offsets (for TextInfo operations)
-		self.pyOffsets = [0]
-		self.utf16Offsets = [0]
-		currentUtf16 = 0
-		lastPy = 0
-
-		for m in NEWLINE_REGEX.finditer(self.documentText):
-			pyEnd = m.end()
-			chunk = self.documentText[lastPy:pyEnd]
-			# Calculate UTF-16 length
-			chunkUtf16Len = len(chunk.encode("utf-16-le")) // 2
-			currentUtf16 += chunkUtf16Len
+		previous = self._previous
+		self._previous = None
+		if previous is not None and previous.documentText == self.documentText:
+			self._adoptIndexes(previous)
+		else:
+			# Calculate offsets: Python indices (for regex/slicing) are needed right away,
+			# UTF-16 offsets (for TextInfo operations) are computed on first use.
+			# Offset tables are stored as compact C int arrays rather than lists of int objects
+			self.pyOffsets = array("i", _splitLines(self.documentText))
+			self.nLines = len(self.pyOffsets)
+		# The hosting app cannot change while the document is loaded
+		self.isWeb = getattr(self.obj.appModule, "appName", "").lower() in WEB_APP_NAMES
+
+		self.refreshCaret()
+		return self
 
-			self.pyOffsets.append(pyEnd)
-			self.utf16Offsets.append(currentUtf16)
-			lastPy = pyEnd
+	def _adoptIndexes(self, other: FastDocumentManager) -> None:
+		"""Take over everything other derived from its text, which is equal to this manager's text."""
+		self.documentText = other.documentText
+		self.pyOffsets = other.pyOffsets
+		self.nLines = other.nLines
+		self._lineCache = other._lineCache
+		self._matchLines = other._matchLines
+		self._runKeys = other._runKeys
+		for name in ("astralPositions", "utf16Offsets"):
+			if name in other.__dict__:
+				self.__dict__[name] = other.__dict__[name]
+
+	def refreshCaret(self) -> None:
+		"""Read the caret position and make its line the current one."""
+		try:
+			caret = self.obj.makeTextInfo(textInfos.POSITION_CARET)
+		except (NotImplementedError, LookupError, COMError) as e:
+			raise RuntimeError(f"Cannot obtain caret TextInfo: {e}")
+		caret.collapse()
+		pretext = caret.copy()
+		pretext.setEndPoint(self.document, "startToStart")
 
 		# Determine caret line using Python offsets
 		# Note: len(pretext.text) returns Python character count
 		caretOffset = len(pretext.text)
+		if caretOffset > len(self.documentText):
+			raise RuntimeError("Caret lies beyond the loaded document text")
+		self.originalCaret = caret
 		self.initialCaretOffset = caretOffset
-		self.lineIndex = bisect.bisect_right(self.pyOffsets, caretOffset) - 1
-		if self.lineIndex < 0:
-			self.lineIndex = 0
+		self.lineIndex = self.findLineIndex(caretOffset)
 		self.originalLineIndex = self.lineIndex
-		self.nLines = len(self.pyOffsets)
-
-		return self
 
 	def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-		pass
+		"""Release the object and its TextInfos.
+
+		The text and everything derived from it are kept, so that the manager can still serve
+		as the previous manager of a later one.
+		"""
+		self.obj = None
+		self.document = None
+		self.originalCaret = None
+
+	@cached_property
+	def astralPositions(self) -> list[int]:
+		"""Python offsets of the document's astral characters, found once on first use."""
+		return _findAstralPositions(self.documentText)
+
+	@cached_property
+	def utf16Offsets(self) -> array[int]:
+		"""UTF-16 start offsets of each line.
+
+		Built on first access, as only UTF-16 offset based TextInfos and web documents need them.
+		"""
+		return _getUtf16Offsets(self.pyOffsets, self.astralPositions)
+
+	def toUtf16Offset(self, pyOffset: int) -> int:
+		"""Convert a Python offset within the document to UTF-16 code units."""
+		return pyOffset + bisect.bisect_left(self.astralPositions, pyOffset)
+
+	def _getUtf16Offset(self, lineIndex: int) -> int:
+		"""Get the UTF-16 start offset of a line, or of the document end for an index past the last line."""
+		if lineIndex < self.nLines:
+			return self.utf16Offsets[lineIndex]
+		# Handle end-of-document case
+		return self.toUtf16Offset(len(self.documentText))
+
+	def findLineIndex(self, pyOffset: int) -> int:
+		"""Get the index of the line containing the given Python offset.
+
+		The last result is remembered, so repeated lookups within one line skip the binary search.
+		"""
+		lineIndex = self._lastFoundLine
+		if self.pyOffsets[lineIndex] <= pyOffset and (
+			lineIndex + 1 >= self.nLines or pyOffset < self.pyOffsets[lineIndex + 1]
+		):
+			return lineIndex
+		lineIndex = max(bisect.bisect_right(self.pyOffsets, pyOffset) - 1, 0)
+		self._lastFoundLine = lineIndex
+		return lineIndex
+
+	def getMatchLines(self, regex: re.Pattern) -> list[int]:
+		"""Get the sorted indices of all lines in which regex finds a match.
+
+		The preloaded text is scanned once per pattern; later calls reuse the result.
+		"""
+		matchLines = self._matchLines.get(regex)
+		if matchLines is None and (regex is patterns.RE_HEADING or regex in patterns.HEADING_LEVELS):
+			self._indexHeadings()
+			matchLines = self._matchLines[regex]
+		if matchLines is None:
+			text = self.documentText
+			search = regex.search
+			matchLines = [
+				lineIndex
+				for lineIndex, startOffset, endOffset in self._iterLines(patterns.LINE_MARKERS.get(regex))
+				if search(text[startOffset:endOffset])
+			]
+			self._matchLines[regex] = matchLines
+		return matchLines
+
+	def _iterLines(self, marker: str | None = None) -> Iterator[tuple[int, int, int]]:
+		"""Iterate over the index, start offset and end offset of the document's lines.
+
+		With a marker, lines that do not contain it may be skipped: while few lines hold the marker,
+		str.find jumps from one such line to the next in C, so other lines are never sliced or matched.
+		"""
+		text = self.documentText
+		starts = self.pyOffsets
+		# Jumping only pays off while the marker is rare
+		if marker is not None and text.count(marker) * 3 < self.nLines:
+			return self._iterMarkedLines(marker)
+		ends = starts[1:]
+		ends.append(len(text))
+		return zip(range(self.nLines), starts, ends)
+
+	def _iterMarkedLines(self, marker: str) -> Iterator[tuple[int, int, int]]:
+		"""Iterate over the index, start offset and end offset of the lines that contain marker."""
+		text = self.documentText
+		find = text.find
+		starts = self.pyOffsets
+		lastLine = self.nLines - 1
+		lineIndex = 0
+		pos = find(marker)
+		while pos != -1:
+			# Found offsets only grow, so each search starts from the previous line
+			lineIndex = bisect.bisect_right(starts, pos, lineIndex) - 1
+			endOffset = starts[lineIndex + 1] if lineIndex < lastLine else len(text)
+			yield lineIndex, starts[lineIndex], endOffset
+			pos = find(marker, endOffset)
+
+	def _indexHeadings(self) -> None:
+		"""Fill the match index of RE_HEADING and of every heading level pattern in one pass.
+
+		patterns.headingLevel sorts each heading line by level as it is found.
+		"""
+		text = self.documentText
+		headingLevel = patterns.headingLevel
+		headingLines = []
+		levelLines = {level: [] for level in patterns.HEADING_LEVELS.values()}
+		for lineIndex, startOffset, endOffset in self._iterLines(patterns.LINE_MARKERS[patterns.RE_HEADING]):
+			level = headingLevel(text[startOffset:endOffset])
+			if level:
+				headingLines.append(lineIndex)
+				levelLines[level].append(lineIndex)
+		self._matchLines[patterns.RE_HEADING] = headingLines
+		for regex, level in patterns.HEADING_LEVELS.items():
+			self._matchLines[regex] = levelLines[level]
+
+	def _getRunKeys(self, regex: re.Pattern) -> list[int]:
+		"""Get each matching line's index minus its position in the match index.
+
+		Consecutive matching lines share a key and later runs have larger ones,
+		so the list is sorted and every run of matching lines is one block of equal keys.
+		"""
+		runKeys = self._runKeys.get(regex)
+		if runKeys is None:
+			runKeys = [line - i for i, line in enumerate(self.getMatchLines(regex))]
+			self._runKeys[regex] = runKeys
+		return runKeys
+
+	def getBlockStart(self, regex: re.Pattern, lineIndex: int) -> int:
+		"""Get the first line of the run of consecutive regex-matching lines that contains lineIndex.
+
+		The run's edge is found by bisecting its key, so no line text is fetched or matched again.
+		"""
+		matchLines = self.getMatchLines(regex)
+		runKeys = self._getRunKeys(regex)
+		i = bisect.bisect_left(matchLines, lineIndex)
+		return matchLines[bisect.bisect_left(runKeys, runKeys[i])]
+
+	def getBlockEnd(self, regex: re.Pattern, lineIndex: int) -> int:
+		"""Get the last line of the run of consecutive regex-matching lines that contains lineIndex."""
+		matchLines = self.getMatchLines(regex)
+		runKeys = self._getRunKeys(regex)
+		i = bisect.bisect_left(matchLines, lineIndex)
+		return matchLines[bisect.bisect_right(runKeys, runKeys[i]) - 1]
+
+	def findNextBlockStart(self, regex: re.Pattern) -> int | None:
+		"""Find the first line after the current one that starts a run of consecutive regex-matching lines.
+
+		:return: The line index, or None if no run starts after the current line.
+		"""
+		matchLines = self.getMatchLines(regex)
+		runKeys = self._getRunKeys(regex)
+		i = bisect.bisect_right(matchLines, self.lineIndex)
+		if 0 < i < len(runKeys) and runKeys[i - 1] == runKeys[i]:
+			# Inside a run that carries on past the current line: skip to the next run
+			i = bisect.bisect_right(runKeys, runKeys[i])
+		if i < len(matchLines):
+			return matchLines[i]
+		return None
+
+	def findMatchLine(self, regex: re.Pattern, direction: int) -> int | None:
+		"""Find the nearest line matching regex after (direction 1) or before (direction -1) the current one.
+
+		:return: The line index, or None if there is no such line.
+		"""
+		matchLines = self.getMatchLines(regex)
+		if direction == 1:
+			i = bisect.bisect_right(matchLines, self.lineIndex)
+		else:
+			i = bisect.bisect_left(matchLines, self.lineIndex) - 1
+		if 0 <= i < len(matchLines):
+			return matchLines[i]
+		return None
 
 	def move(self, increment: int) -> int:
 		"""Move to the next or previous line.
@@ -133,12 +391,39 @@ class FastDocumentManager:
 			lineIndex = self.lineIndex
 		if lineIndex < 0 or lineIndex >= self.nLines:
 			return ""
+		text = self._lineCache.get(lineIndex)
+		if text is not None:
+			return text
+		startOffset, endOffset = self.getLineBounds(lineIndex)
+		text = self.documentText[startOffset:endOffset]
+		if len(self._lineCache) >= LINE_CACHE_SIZE:
+			# Evict the oldest entry; dicts keep insertion order
+			del self._lineCache[next(iter(self._lineCache))]
+		self._lineCache[lineIndex] = text
+		return text
+
+	def getLineBounds(self, lineIndex: int | None = None) -> tuple[int, int]:
+		"""Get the Python start and end offsets of the specified line (or current line).
+
+		The end offset includes the line's trailing newline, if any.
+		"""
+		if lineIndex is None:
+			lineIndex = self.lineIndex
 		startOffset = self.pyOffsets[lineIndex]
-		try:
-			endOffset = self.pyOffsets[lineIndex + 1]
-		except IndexError:
-			endOffset = len(self.documentText)
-		return self.documentText[startOffset:endOffset]
+		if lineIndex + 1 < self.nLines:
+			return startOffset, self.pyOffsets[lineIndex + 1]
+		return startOffset, len(self.documentText)
+
+	def getUtf16LineOffset(self, pyOffset: int, lineIndex: int | None = None) -> int:
+		"""Convert a Python offset within the specified line (or current line) to UTF-16 code units.
+
+		Both ends are looked up in the document-wide astral positions, so nothing is re-encoded.
+		"""
+		if not self.astralPositions:
+			return pyOffset
+		if lineIndex is None:
+			lineIndex = self.lineIndex
+		return self.toUtf16Offset(self.pyOffsets[lineIndex] + pyOffset) - self.utf16Offsets[lineIndex]
 
 	def getLineOffset(self, lineIndex: int | None = None) -> int:
 		"""Get the Python start offset of the specified line (or current line)."""
@@ -158,11 +443,9 @@ class FastDocumentManager:
 			textInfo = self.document.copy()
 			offset = 0
 
-			# Try using textUtils to handle different encodings (e.g., Scintilla's UTF-8)
+			# Try using textUtils to handle other encodings (e.g., Scintilla's UTF-8)
 			encoding = getattr(textInfo, "encoding", None)
-			if encoding:
-				from textUtils import getOffsetConverter
-
+			if encoding and encoding != WCHAR_ENCODING:
 				pyOffset = self.pyOffsets[lineIndex]
 				try:
 					converter = getOffsetConverter(encoding)(self.documentText)
@@ -175,24 +458,11 @@ class FastDocumentManager:
 						f"FastDocumentManager: textUtils conversion failed ({e}), falling back to UTF-16",
 					)
 					# Fall back to precomputed UTF-16 offsets
-					if lineIndex < len(self.utf16Offsets):
-						offset = self.utf16Offsets[lineIndex]
-					else:
-						# Handle end-of-document case
-						lastKnownPy = self.pyOffsets[-1]
-						lastKnownUtf16 = self.utf16Offsets[-1]
-						remainingText = self.documentText[lastKnownPy:]
-						offset = lastKnownUtf16 + (len(remainingText.encode("utf-16-le")) // 2)
+					offset = self._getUtf16Offset(lineIndex)
 			else:
-				# No specific encoding, default to Windows UTF-16
-				if lineIndex < len(self.utf16Offsets):
-					offset = self.utf16Offsets[lineIndex]
-				else:
-					# Handle end-of-document case
-					lastKnownPy = self.pyOffsets[-1]
-					lastKnownUtf16 = self.utf16Offsets[-1]
-					remainingText = self.documentText[lastKnownPy:]
-					offset = lastKnownUtf16 + (len(remainingText.encode("utf-16-le")) // 2)
+				# Windows UTF-16 (explicit or by default) maps directly onto the precomputed offsets,
+				# without converting the whole document on every call
+				offset = self._getUtf16Offset(lineIndex)
 
 			textInfo._startOffset = textInfo._endOffset = offset
 			textInfo.expand(textInfos.UNIT_LINE)
@@ -200,10 +470,7 @@ class FastDocumentManager:
 		else:
 			# Fallback for non-OffsetsTextInfo
 			# Check if this is a web browser environment for optimized positioning
-			appName = getattr(self.obj.appModule, "appName", "").lower()
-			isWeb = appName in ("chrome", "msedge", "firefox", "opera", "brave", "browser")
-
-			if isWeb:
+			if self.isWeb:
 				self.pyOffsets[lineIndex] if lineIndex < self.nLines else len(self.documentText)
 
 				# Optimization V3: Use flattened IA2TextTextInfo with manual offset injection
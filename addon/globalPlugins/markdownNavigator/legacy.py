@@ -17,6 +17,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import addonHandler
+import functools
 import re
 import controlTypes
 import textInfos
@@ -25,6 +26,7 @@ import speech
 from logHandler import log
 from _ctypes import COMError
 from . import patterns
+from textInfos.offsets import OffsetsTextInfo
 from textUtils import WideStringOffsetConverter
 from NVDAObjects.IAccessible import IA2TextTextInfo
 
@@ -34,6 +36,20 @@ if TYPE_CHECKING:
 	from NVDAObjects import NVDAObject
 
 
+@functools.lru_cache(maxsize=16)
+def _get_offset_converter(text: str) -> WideStringOffsetConverter:
+	"""Return a UTF-16 offset converter for a line, reusing it across repeated table gestures."""
+	return WideStringOffsetConverter(text)
+
+
+def _line_search(regex: re.Pattern, text: str) -> bool:
+	"""Check whether regex matches text, using its bytes twin when one exists."""
+	bregex = patterns.BYTES_PATTERNS.get(regex)
+	if bregex is None:
+		return regex.search(text) is not None
+	return bregex.search(text.encode("latin-1", "replace")) is not None
+
+
 def _step_line(ti: textInfos.TextInfo, direction: int) -> bool:
 	"""Move TextInfo to the next or previous line using hybrid approach.
 
@@ -42,7 +58,14 @@ def _step_line(ti: textInfos.TextInfo, direction: int) -> bool:
 
 	:return: True if moved successfully, False if at EOF/BOF.
 	"""
-	tiOriginal = ti.copy()
+	# Offset based TextInfos are snapshotted as plain ints instead of being copied,
+	# and movement is proven by comparing offsets, saving compareEndPoints calls
+	# (a window message each for Scintilla/RichEdit)
+	isOffsets = isinstance(ti, OffsetsTextInfo)
+	if isOffsets:
+		originalStart, originalEnd = ti._startOffset, ti._endOffset
+	else:
+		tiOriginal = ti.copy()
 
 	# Plan A: Efficient Line Movement
 	try:
@@ -52,7 +75,12 @@ def _step_line(ti: textInfos.TextInfo, direction: int) -> bool:
 
 			# Verify physical movement
 			moved = False
-			if direction == 1:
+			if isOffsets:
+				if direction == 1:
+					moved = ti._startOffset > originalStart
+				else:
+					moved = ti._startOffset < originalStart
+			elif direction == 1:
 				if ti.compareEndPoints(tiOriginal, "startToStart") > 0:
 					moved = True
 			else:
@@ -64,8 +92,11 @@ def _step_line(ti: textInfos.TextInfo, direction: int) -> bool:
 
 			# Ghost Loop detected: move() returned non-zero but position didn't change
 			# Reset and try Plan B
-			ti.setEndPoint(tiOriginal, "startToStart")
-			ti.setEndPoint(tiOriginal, "endToEnd")
+			if isOffsets:
+				ti._startOffset, ti._endOffset = originalStart, originalEnd
+			else:
+				ti.setEndPoint(tiOriginal, "startToStart")
+				ti.setEndPoint(tiOriginal, "endToEnd")
 		else:
 			# move() returned 0, likely EOF/BOF
 			return False
@@ -80,7 +111,10 @@ def _step_line(ti: textInfos.TextInfo, direction: int) -> bool:
 			ti.collapse(end=True)
 		except (RuntimeError, ValueError, COMError):
 			return False
-		collapsedAnchorPoint = ti.copy()
+		if isOffsets:
+			anchorStart = ti._startOffset
+		else:
+			collapsedAnchorPoint = ti.copy()
 		if ti.move(textInfos.UNIT_CHARACTER, 1) == 0:
 			return False
 	else:
@@ -94,6 +128,10 @@ def _step_line(ti: textInfos.TextInfo, direction: int) -> bool:
 	ti.expand(textInfos.UNIT_LINE)
 
 	# Final verification
+	if isOffsets:
+		if direction == 1:
+			return originalStart < ti._startOffset and anchorStart <= ti._startOffset
+		return ti._startOffset < originalStart
 	if direction == 1:
 		if ti.compareEndPoints(tiOriginal, "startToStart") <= 0:
 			return False
@@ -132,18 +170,7 @@ def navigate_legacy(
 		tiToCaret = tiLineStart.copy()
 		tiToCaret.setEndPoint(ti, "endToEnd")
 		caret_offset = len(tiToCaret.text)
-		target_match = None
-		matches = list(regex.finditer(text))
-		if direction == 1:
-			for m in matches:
-				if m.start() > caret_offset:
-					target_match = m
-					break
-		else:
-			for m in reversed(matches):
-				if m.start() < caret_offset:
-					target_match = m
-					break
+		target_match = patterns.findMatch(regex, text, caret_offset, direction)
 		if target_match:
 			tiLine.collapse()
 			tiLine.move(textInfos.UNIT_CHARACTER, target_match.start())
@@ -154,10 +181,9 @@ def navigate_legacy(
 		found = False
 		while _step_line(tiScan, direction):
 			text = tiScan.text
-			matches = list(regex.finditer(text))
-			if matches:
+			m = regex.search(text) if direction == 1 else patterns.findMatch(regex, text, len(text) + 1, -1)
+			if m:
 				found = True
-				m = matches[0] if direction == 1 else matches[-1]
 				tiScan.collapse()
 				tiScan.move(textInfos.UNIT_CHARACTER, m.start())
 				tiScan.updateCaret()
@@ -176,7 +202,7 @@ def navigate_legacy(
 		found = False
 		while _step_line(tiScan, direction):
 			text = tiScan.text
-			if regex.search(text):
+			if _line_search(regex, text):
 				found = True
 				tiScan.collapse()
 				tiScan.updateCaret()
@@ -209,18 +235,19 @@ def navigate_block_legacy(
 	tiScan.collapse()
 	tiLine = tiScan.copy()
 	tiLine.expand(textInfos.UNIT_LINE)
-	in_block = bool(regex.match(tiLine.text))
+	match = regex.match
+	in_block = bool(match(tiLine.text))
 
 	if direction == -1 and in_block:
 		tiPrev = tiLine.copy()
 		if _step_line(tiPrev, -1):
-			if regex.match(tiPrev.text):
+			if match(tiPrev.text):
 				target_ti = tiLine.copy()
 				while True:
 					temp_ti = target_ti.copy()
 					if not _step_line(temp_ti, -1):
 						break
-					if not regex.match(temp_ti.text):
+					if not match(temp_ti.text):
 						break
 					target_ti = temp_ti
 				target_ti.collapse()
@@ -237,7 +264,7 @@ def navigate_block_legacy(
 	found = False
 	while _step_line(tiScan, direction):
 		text = tiScan.text
-		is_match = bool(regex.match(text))
+		is_match = bool(match(text))
 		if in_block:
 			if not is_match:
 				in_block = False
@@ -249,7 +276,7 @@ def navigate_block_legacy(
 						temp_ti = target_ti.copy()
 						if not _step_line(temp_ti, -1):
 							break
-						if not regex.match(temp_ti.text):
+						if not match(temp_ti.text):
 							break
 						target_ti = temp_ti
 					tiScan = target_ti
@@ -285,7 +312,7 @@ def navigate_code_legacy(
 	tiOriginal = ti.copy()
 	tiLine = ti.copy()
 	tiLine.expand(textInfos.UNIT_LINE)
-	on_boundary = bool(patterns.RE_CODE_BLOCK.match(tiLine.text))
+	on_boundary = patterns.isCodeFence(tiLine.text)
 	# Base for scanning
 	tiScan = tiLine.copy()
 	if on_boundary:
@@ -294,7 +321,7 @@ def navigate_code_legacy(
 			should_skip = False
 		if should_skip:
 			while _step_line(tiScan, direction):
-				if patterns.RE_CODE_BLOCK.match(tiScan.text):
+				if patterns.isCodeFence(tiScan.text):
 					break
 	else:
 		tiCurrentLine = tiOriginal.copy()
@@ -305,18 +332,7 @@ def navigate_code_legacy(
 		tiToCaret = tiLineStart.copy()
 		tiToCaret.setEndPoint(tiOriginal, "endToEnd")
 		caret_offset = len(tiToCaret.text)
-		matches = list(patterns.RE_INLINE_CODE.finditer(text))
-		target_match = None
-		if direction == 1:
-			for m in matches:
-				if m.start() > caret_offset:
-					target_match = m
-					break
-		else:
-			for m in reversed(matches):
-				if m.start() < caret_offset:
-					target_match = m
-					break
+		target_match = patterns.findMatch(patterns.RE_INLINE_CODE, text, caret_offset, direction)
 		if target_match:
 			tiCurrentLine.collapse()
 			tiCurrentLine.move(textInfos.UNIT_CHARACTER, target_match.start())
@@ -327,7 +343,7 @@ def navigate_code_legacy(
 	found = False
 	while _step_line(tiScan, direction):
 		text = tiScan.text
-		if patterns.RE_CODE_BLOCK.match(text):
+		if patterns.isCodeFence(text):
 			# Logic for Previous Direction (-1):
 			if direction == -1:
 				has_info = len(text.strip()) > 3
@@ -336,7 +352,7 @@ def navigate_code_legacy(
 				else:
 					tiScanUp = tiScan.copy()
 					while _step_line(tiScanUp, -1):
-						if patterns.RE_CODE_BLOCK.match(tiScanUp.text):
+						if patterns.isCodeFence(tiScanUp.text):
 							tiScan = tiScanUp
 							break
 					found = True
@@ -348,10 +364,12 @@ def navigate_code_legacy(
 				tiScan.expand(textInfos.UNIT_LINE)
 				speech.speakTextInfo(tiScan, unit=textInfos.UNIT_LINE, reason=controlTypes.OutputReason.CARET)
 				break
-		matches = list(patterns.RE_INLINE_CODE.finditer(text))
-		if matches:
+		if direction == 1:
+			m = patterns.RE_INLINE_CODE.search(text)
+		else:
+			m = patterns.findMatch(patterns.RE_INLINE_CODE, text, len(text) + 1, -1)
+		if m:
 			found = True
-			m = matches[0] if direction == 1 else matches[-1]
 			tiScan.collapse()
 			tiScan.move(textInfos.UNIT_CHARACTER, m.start())
 			tiScan.updateCaret()
@@ -366,45 +384,18 @@ def navigate_code_legacy(
 		ui.message(msg)
 
 
-def _parse_table_row(text: str) -> list[dict]:
-	"""Parses a Markdown table row into a list of cell dictionaries."""
-	cells = []
-	# Split by pipe, but keep the delimiter to calculate offsets
-	# Regex looks for | not preceded by \
-	pattern = re.compile(r"(?<!\\)\|")
-	matches = list(pattern.finditer(text))
-	if not matches:
-		return []
-	for i in range(len(matches) - 1):
-		start_pipe = matches[i]
-		end_pipe = matches[i + 1]
-		cell_start = start_pipe.end()
-		cell_end = end_pipe.start()
-		cell_text = text[cell_start:cell_end]
-		stripped = cell_text.strip()
-		content_start = cell_start + cell_text.find(stripped) if stripped else cell_start
-		content_end = content_start + len(stripped)
-		cells.append(
-			{
-				"start": cell_start,
-				"end": cell_end,
-				"content_start": content_start,
-				"content_end": content_end,
-				"text": stripped,
-			},
-		)
-	return cells
-
-
 def navigate_table_legacy(
 	obj: NVDAObject,
 	gesture,
 	row_dir: int,
 	col_dir: int,
+	isWeb: bool,
 ) -> None:
-	"""Legacy table navigation using line-by-line scanning and IA2 text info optimization where possible."""
+	"""Legacy table navigation using line-by-line scanning and IA2 text info optimization where possible.
+
+	:param isWeb: Whether obj is hosted by a browser, whose caret is placed through flat IA2 text.
+	"""
 	# Web special handling: Use Flat IA 2 Info
-	isWeb = getattr(obj.appModule, "appName", "").lower() in ("chrome", "msedge")
 	try:
 		if isWeb and hasattr(obj, "IAccessibleTextObject"):
 			ti = IA2TextTextInfo(obj, textInfos.POSITION_CARET)
@@ -422,7 +413,7 @@ def navigate_table_legacy(
 		return
 
 	# 1. Parse current row
-	cells = _parse_table_row(tiLine.text)
+	cells = patterns.parseTableRow(tiLine.text)
 	if not cells:
 		gesture.send()
 		return
@@ -431,7 +422,7 @@ def navigate_table_legacy(
 	# Calculate relative offset
 	# If it's Flat Info, _startOffset is the global UTF-16 offset
 	# Create converter for current line to handle Emoji math
-	line_converter = WideStringOffsetConverter(tiLine.text)
+	line_converter = _get_offset_converter(tiLine.text)
 
 	if isWeb and isinstance(ti, IA2TextTextInfo):
 		# caret_abs, line_start_abs are UTF-16
@@ -496,7 +487,7 @@ def navigate_table_legacy(
 		if not patterns.RE_TABLE.match(tiScan.text):
 			ui.message(_("Edge of table"))
 			return
-		new_cells = _parse_table_row(tiScan.text)
+		new_cells = patterns.parseTableRow(tiScan.text)
 		if not new_cells:
 			ui.message(_("Edge of table"))
 			return
@@ -507,7 +498,7 @@ def navigate_table_legacy(
 
 		if isWeb and isinstance(tiScan, IA2TextTextInfo):
 			# Need converter for the NEW line -> tiScan.text
-			scan_converter = WideStringOffsetConverter(tiScan.text)
+			scan_converter = _get_offset_converter(tiScan.text)
 			target_utf16_offset = scan_converter.strToEncodedOffsets(target_char_offset)
 
 			new_abs = tiScan._startOffset + target_utf16_offset
@@ -5,8 +5,12 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from functools import cached_property
 
 import addonHandler
+import bisect
+import core
 import controlTypes
 import textInfos
 import ui
@@ -25,17 +29,99 @@ from _ctypes import COMError
 from NVDAObjects.IAccessible import IA2TextTextInfo
 
 from .document import FastDocumentManager
+from .legacy import (
+	navigate_legacy,
+	navigate_block_legacy,
+	navigate_code_legacy,
+	navigate_table_legacy,
+)
 
 addonHandler.initTranslation()
 
 if TYPE_CHECKING:
 	pass
 
+#: Lowercase app names whose documents accept caret placement by injected IA2 offsets.
+OFFSET_INJECTION_APP_NAMES = frozenset({"chrome", "msedge"})
+
+#: Milliseconds for which the text and match indexes of the last navigated document are kept.
+DOCUMENT_CACHE_TIMEOUT = 10000
+
+#: Quick navigation keys served by MarkdownEditorOverlay.script_navigateElement, pressed alone to move forward
+#: and with shift to move back. Each maps to (pattern, element name, whether the caret lands on the match
+#: rather than the line, message when there is no next element, message when there is no previous one).
+ELEMENT_NAVIGATION_KEYS = {
+	"h": (patterns.RE_HEADING, _("heading"), False, _("no next heading"), _("no previous heading")),
+	"i": (patterns.RE_LIST_ITEM, _("list item"), False, _("no next list item"), _("no previous list item")),
+	"k": (patterns.RE_LINK, _("link"), True, _("no next link"), _("no previous link")),
+	"g": (patterns.RE_IMAGE, _("image"), True, _("no next graphic"), _("no previous graphic")),
+	"m": (
+		patterns.RE_LATEX_MATH,
+		# Translators: The element type announced when navigating to a math formula.
+		_("math formula"),
+		True,
+		# Translators: Message announced when there is no next math formula to navigate to.
+		_("no next math formula"),
+		# Translators: Message announced when there is no previous math formula to navigate to.
+		_("no previous math formula"),
+	),
+	# Italics (E - Emphasis)
+	"e": (patterns.RE_ITALIC, _("italic"), True, _("no next italic"), _("no previous italic")),
+	# Strikethrough (D - Delete)
+	"d": (
+		patterns.RE_STRIKETHROUGH,
+		_("strikethrough"),
+		True,
+		_("no next strikethrough"),
+		_("no previous strikethrough"),
+	),
+	"b": (patterns.RE_BOLD, _("bold"), True, _("no next bold"), _("no previous bold")),
+	"f": (patterns.RE_FOOTNOTE, _("footnote"), True, _("no next footnote"), _("no previous footnote")),
+	"s": (patterns.RE_SEPARATOR, _("separator"), False, _("no next separator"), _("no previous separator")),
+	"x": (patterns.RE_CHECKBOX, _("checkbox"), False, _("no next check box"), _("no previous check box")),
+}
+
+# Element names and not-found messages of the block and code keys, translated once at import
+TABLE_NAME = _("table")
+NO_NEXT_TABLE = _("no next table")
+NO_PREVIOUS_TABLE = _("no previous table")
+LIST_NAME = _("list")
+NO_NEXT_LIST = _("no next list")
+NO_PREVIOUS_LIST = _("no previous list")
+BLOCKQUOTE_NAME = _("blockquote")
+NO_NEXT_BLOCKQUOTE = _("no next block quote")
+NO_PREVIOUS_BLOCKQUOTE = _("no previous block quote")
+CODE_NAME = _("code")
+NO_NEXT_CODE = _("no next code")
+NO_PREVIOUS_CODE = _("no previous code")
+
+#: Element names of the heading level keys 1 to 6.
+HEADING_LEVEL_NAMES = (
+	_("level 1 heading"),
+	_("level 2 heading"),
+	_("level 3 heading"),
+	_("level 4 heading"),
+	_("level 5 heading"),
+	_("level 6 heading"),
+)
+
+#: Block whose edges the boundary scripts seek, by the kind patterns.classifyLine gives the current line.
+BOUNDARY_BLOCK_PATTERNS = {
+	"listItem": patterns.RE_LIST_ITEM,
+	"table": patterns.RE_TABLE,
+	"blockquote": patterns.RE_BLOCKQUOTE,
+}
+
 
 class MarkdownEditorOverlay(ScriptableObject):
 	"""Overlay class to add Markdown navigation capabilities to EditableText objects."""
 
 	markdownBrowseMode: bool = False
+	#: The most recently parsed table row as (line text, cells), reused while the caret stays on that row.
+	_lastTableRow: tuple[str, list[dict]] | None = None
+	#: The released document manager of the last navigation gesture, dropped after DOCUMENT_CACHE_TIMEOUT
+	#: and whenever a gesture reaches the application.
+	_cachedFdm: FastDocumentManager | None = None
 
 	@script(
 		# Translators: Description for the toggle script.
@@ -58,9 +144,20 @@ class MarkdownEditorOverlay(ScriptableObject):
 				# Translators: Message when mode is disabled.
 				ui.message(_("Markdown Browse Mode Off"))
 
+	@cached_property
+	def _isWebApp(self) -> bool:
+		"""Whether this object lives in a browser that accepts injected IA2 offsets.
+
+		The hosting app never changes for an object, so this is worked out once.
+		"""
+		return getattr(self.appModule, "appName", "").lower() in OFFSET_INJECTION_APP_NAMES
+
 	def getScript(self, gesture):
 		"""Handle browse mode specific gesture trapping."""
 		script = super().getScript(gesture)
+		if getattr(script, "__name__", None) not in MarkdownEditorOverlay.__dict__:
+			# Any other gesture may move the caret or edit the text, so the next navigation reloads.
+			self._cachedFdm = None
 		if not getattr(self, "markdownBrowseMode", False):
 			return script
 
@@ -76,6 +173,25 @@ class MarkdownEditorOverlay(ScriptableObject):
 	def script_trapNonCommandGesture(self, gesture) -> None:
 		winsound.MessageBeep()
 
+	@contextmanager
+	def _documentManager(self):
+		"""Provide a loaded FastDocumentManager.
+
+		The text is loaded on every gesture, as it may have been edited by gestures that never
+		reach this overlay. While it equals the text of the previous gesture, that gesture's
+		line tables and match indexes are reused.
+		"""
+		fdm = FastDocumentManager(self, previous=self._cachedFdm)
+		self._cachedFdm = None
+		with fdm:
+			yield fdm
+		self._cachedFdm = fdm
+		core.callLater(DOCUMENT_CACHE_TIMEOUT, self._dropCachedDocument, fdm)
+
+	def _dropCachedDocument(self, fdm: FastDocumentManager) -> None:
+		if self._cachedFdm is fdm:
+			self._cachedFdm = None
+
 	def _navigate(
 		self,
 		gesture,
@@ -98,15 +214,14 @@ class MarkdownEditorOverlay(ScriptableObject):
 		:param notFoundMessage: Custom message when element not found.
 		"""
 		if not getattr(self, "markdownBrowseMode", False):
+			self._cachedFdm = None
 			gesture.send()
 			return
 		try:
-			with FastDocumentManager(self) as fdm:
+			with self._documentManager() as fdm:
 				self._navigateFast(fdm, regex, direction, name, focus_element, notFoundMessage)
 		except (RuntimeError, NotImplementedError, LookupError, COMError) as e:
 			log.debugWarning(f"MarkdownNavigator: FastDocumentManager failed ({e}), falling back to legacy")
-			from .legacy import navigate_legacy
-
 			navigate_legacy(self, gesture, regex, direction, name, focus_element, notFoundMessage)
 
 	def _navigateFast(
@@ -118,48 +233,29 @@ class MarkdownEditorOverlay(ScriptableObject):
 		focus_element: bool,
 		notFoundMessage: str | None,
 	) -> None:
-		from textUtils import WideStringOffsetConverter
-
 		if focus_element:
 			currentLineText = fdm.getText()
 			lineStartOffset = fdm.getLineOffset()
 			# Check if we can use Flat Injection (Web Optimization)
-			isWeb = getattr(self.appModule, "appName", "").lower() in ("chrome", "msedge")
+			isWeb = self._isWebApp
 
 			# Calculate caret offset within current line
-			# Note: getLineOffset returns Python string offset
-			try:
-				pretext = fdm.originalCaret.copy()
-				pretext.setEndPoint(fdm.document, "startToStart")
-				docCaretPos = len(pretext.text)
-				caret_offset = docCaretPos - lineStartOffset
-			except Exception:
-				caret_offset = 0
-
-			matches = list(regex.finditer(currentLineText))
-			target_match = None
-			if direction == 1:
-				for m in matches:
-					if m.start() > caret_offset:
-						target_match = m
-						break
-			else:
-				for m in reversed(matches):
-					if m.start() < caret_offset:
-						target_match = m
-						break
+			# Note: both offsets are Python string offsets, the caret one measured once on load
+			caret_offset = fdm.initialCaretOffset - lineStartOffset
+
+			target_match = patterns.findMatch(regex, currentLineText, caret_offset, direction)
 
 			if target_match:
 				lineInfo = fdm.getTextInfo()
+				matched_text = target_match.group()
 
 				if isWeb and isinstance(lineInfo, IA2TextTextInfo):
 					# Web Optimization: Calculate Global UTF-16 Offset and Inject
-					prefix = currentLineText[: target_match.start()]
-					converter = WideStringOffsetConverter(prefix)
-					utf16_delta = converter.encodedStringLength
+					utf16_delta = fdm.getUtf16LineOffset(target_match.start())
 
 					new_abs = lineInfo._startOffset + utf16_delta
-					match_len_utf16 = WideStringOffsetConverter(target_match.group()).encodedStringLength
+					# Both ends come from the document-wide astral positions, so nothing is re-encoded
+					match_len_utf16 = fdm.getUtf16LineOffset(target_match.end()) - utf16_delta
 
 					lineInfo._startOffset = new_abs
 					lineInfo._endOffset = new_abs + match_len_utf16
@@ -167,47 +263,47 @@ class MarkdownEditorOverlay(ScriptableObject):
 					# Update caret
 					lineInfo.updateCaret()
 					# Speak content
-					speech.speak([target_match.group()])
+					speech.speak([matched_text])
 					return
 				else:
 					# Fallback / Desktop
 					lineInfo.collapse()
 					lineInfo.move(textInfos.UNIT_CHARACTER, target_match.start())
 					lineInfo.updateCaret()
-					speech.speak([target_match.group()])
+					speech.speak([matched_text])
 					return
 
-			found = False
-			while fdm.move(direction) != 0:
+			# Jump straight to the nearest matching line using the per-document match index
+			targetLine = fdm.findMatchLine(regex, direction)
+			found = targetLine is not None
+			if found:
+				fdm.lineIndex = targetLine
 				text = fdm.getText()
-				matches = list(regex.finditer(text))
-				if matches:
-					found = True
-					m = matches[0] if direction == 1 else matches[-1]
-					lineInfo = fdm.getTextInfo()
+				if direction == 1:
+					m = regex.search(text)
+				else:
+					m = patterns.findMatch(regex, text, len(text) + 1, -1)
+				lineInfo = fdm.getTextInfo()
+				matched_text = m.group()
 
-					if isWeb and isinstance(lineInfo, IA2TextTextInfo):
-						# Web Optimization: Offset Injection
-						prefix = text[: m.start()]
-						converter = WideStringOffsetConverter(prefix)
-						utf16_delta = converter.encodedStringLength
+				if isWeb and isinstance(lineInfo, IA2TextTextInfo):
+					# Web Optimization: Offset Injection
+					utf16_delta = fdm.getUtf16LineOffset(m.start())
 
-						new_abs = lineInfo._startOffset + utf16_delta
-						match_len_utf16 = WideStringOffsetConverter(m.group()).encodedStringLength
+					new_abs = lineInfo._startOffset + utf16_delta
+					match_len_utf16 = fdm.getUtf16LineOffset(m.end()) - utf16_delta
 
-						lineInfo._startOffset = new_abs
-						lineInfo._endOffset = new_abs + match_len_utf16
+					lineInfo._startOffset = new_abs
+					lineInfo._endOffset = new_abs + match_len_utf16
 
-						lineInfo.updateCaret()
-						speech.speak([m.group()])
-						break
-					else:
-						# Fallback / Desktop
-						lineInfo.collapse()
-						lineInfo.move(textInfos.UNIT_CHARACTER, m.start())
-						lineInfo.updateCaret()
-						speech.speak([m.group()])
-						break
+					lineInfo.updateCaret()
+					speech.speak([matched_text])
+				else:
+					# Fallback / Desktop
+					lineInfo.collapse()
+					lineInfo.move(textInfos.UNIT_CHARACTER, m.start())
+					lineInfo.updateCaret()
+					speech.speak([matched_text])
 
 			if not found:
 				msg = (
@@ -219,18 +315,16 @@ class MarkdownEditorOverlay(ScriptableObject):
 				)
 				ui.message(msg)
 		else:
-			found = False
-			while fdm.move(direction) != 0:
-				text = fdm.getText()
-				if regex.search(text):
-					found = True
-					lineInfo = fdm.updateCaret()
-					speech.speakTextInfo(
-						lineInfo,
-						unit=textInfos.UNIT_LINE,
-						reason=controlTypes.OutputReason.CARET,
-					)
-					break
+			targetLine = fdm.findMatchLine(regex, direction)
+			found = targetLine is not None
+			if found:
+				fdm.lineIndex = targetLine
+				lineInfo = fdm.updateCaret()
+				speech.speakTextInfo(
+					lineInfo,
+					unit=textInfos.UNIT_LINE,
+					reason=controlTypes.OutputReason.CARET,
+				)
 			if not found:
 				msg = (
 					notFoundMessage
@@ -251,15 +345,14 @@ class MarkdownEditorOverlay(ScriptableObject):
 	) -> None:
 		"""Navigation for block elements (tables, code blocks, blockquotes, etc.)."""
 		if not getattr(self, "markdownBrowseMode", False):
+			self._cachedFdm = None
 			gesture.send()
 			return
 		try:
-			with FastDocumentManager(self) as fdm:
+			with self._documentManager() as fdm:
 				self._navigateBlockFast(fdm, regex, direction, name, notFoundMessage)
 		except (RuntimeError, NotImplementedError, LookupError, COMError) as e:
 			log.debugWarning(f"MarkdownNavigator: FastDocumentManager failed for block nav ({e})")
-			from .legacy import navigate_block_legacy
-
 			navigate_block_legacy(self, gesture, regex, direction, name, notFoundMessage)
 
 	def _navigateBlockFast(
@@ -270,47 +363,28 @@ class MarkdownEditorOverlay(ScriptableObject):
 		name: str,
 		notFoundMessage: str | None,
 	) -> None:
-		currentLineText = fdm.getText()
-		in_block = bool(regex.match(currentLineText))
-		# When navigating backward while inside a block, first locate block start
-		if direction == -1 and in_block:
-			prevLine = fdm.lineIndex - 1
-			if prevLine >= 0 and regex.match(fdm.getText(prevLine)):
-				# Find block start
-				startLine = fdm.lineIndex
-				while startLine > 0:
-					if not regex.match(fdm.getText(startLine - 1)):
-						break
-					startLine -= 1
-				lineInfo = fdm.updateCaret(startLine)
-				speech.speakTextInfo(
-					lineInfo,
-					unit=textInfos.UNIT_LINE,
-					reason=controlTypes.OutputReason.CARET,
-				)
-				return
-
-		found = False
-		while fdm.move(direction) != 0:
-			text = fdm.getText()
-			is_match = bool(regex.match(text))
-			if in_block:
-				if not is_match:
-					in_block = False
-			else:
-				if is_match:
-					targetLine = fdm.lineIndex
-					if direction == -1:
-						while targetLine > 0 and regex.match(fdm.getText(targetLine - 1)):
-							targetLine -= 1
-					found = True
-					lineInfo = fdm.updateCaret(targetLine)
-					speech.speakTextInfo(
-						lineInfo,
-						unit=textInfos.UNIT_LINE,
-						reason=controlTypes.OutputReason.CARET,
-					)
-					break
+		# Locate the target block from the per-document match index instead of stepping line by line.
+		# A block starts at a matching line whose previous line does not match.
+		targetLine = None
+		if direction == 1:
+			targetLine = fdm.findNextBlockStart(regex)
+		else:
+			matchLines = fdm.getMatchLines(regex)
+			i = bisect.bisect_left(matchLines, fdm.lineIndex)
+			in_block = i < len(matchLines) and matchLines[i] == fdm.lineIndex
+			# When navigating backward while inside a block, first locate block start
+			if in_block and i > 0 and matchLines[i - 1] == fdm.lineIndex - 1:
+				targetLine = fdm.getBlockStart(regex, fdm.lineIndex)
+			elif i > 0:
+				targetLine = fdm.getBlockStart(regex, matchLines[i - 1])
+		found = targetLine is not None
+		if found:
+			lineInfo = fdm.updateCaret(targetLine)
+			speech.speakTextInfo(
+				lineInfo,
+				unit=textInfos.UNIT_LINE,
+				reason=controlTypes.OutputReason.CARET,
+			)
 		if not found:
 			msg = (
 				notFoundMessage
@@ -321,30 +395,26 @@ class MarkdownEditorOverlay(ScriptableObject):
 
 	def _navigateCode(self, gesture, direction, name, notFoundMessage=None):
 		if not getattr(self, "markdownBrowseMode", False):
+			self._cachedFdm = None
 			gesture.send()
 			return
 		try:
-			with FastDocumentManager(self) as fdm:
+			with self._documentManager() as fdm:
 				self._navigateCodeFast(fdm, direction, name, notFoundMessage)
 		except (RuntimeError, NotImplementedError, LookupError, COMError) as e:
 			log.debugWarning(
 				f"MarkdownNavigator: FastDocumentManager failed for code nav ({e}), falling back",
 			)
-			from .legacy import navigate_code_legacy
-
 			navigate_code_legacy(self, gesture, direction, name, notFoundMessage)
 
 	def _navigateCodeFast(self, fdm, direction, name, notFoundMessage):
 		"""Implementing Code Block Navigation with FastDocumentManager"""
-		from textUtils import WideStringOffsetConverter
-
-		isWeb = getattr(self.appModule, "appName", "").lower() in ("chrome", "msedge")
+		isWeb = self._isWebApp
 
 		currentLineText = fdm.getText()
-		fdm.getTextInfo()  # For fallback anchor
 
 		# Check if within code block boundary
-		on_boundary = bool(patterns.RE_CODE_BLOCK.match(currentLineText))
+		on_boundary = patterns.isCodeFence(currentLineText)
 
 		# === 1. Inline Code Search in Current Line (if not skipping block) ===
 		# If we are already on the boundary and intend to move down, we might intend to skip a block.
@@ -373,39 +443,32 @@ class MarkdownEditorOverlay(ScriptableObject):
 			if caret_char_offset < 0:
 				caret_char_offset = 0
 
-			matches = list(patterns.RE_INLINE_CODE.finditer(currentLineText))
-			target_match = None
-			if direction == 1:
-				for m in matches:
-					if m.start() > caret_char_offset:
-						target_match = m
-						break
-			else:
-				for m in reversed(matches):
-					if m.start() < caret_char_offset:
-						target_match = m
-						break
+			target_match = patterns.findMatch(
+				patterns.RE_INLINE_CODE,
+				currentLineText,
+				caret_char_offset,
+				direction,
+			)
 
 			if target_match:
 				log.debug(f"MarkdownNavigator: Found Inline Code in current line at {target_match.start()}")
 				lineInfo = fdm.getTextInfo()
+				matched_text = target_match.group()
 
 				if isWeb and isinstance(lineInfo, IA2TextTextInfo):
-					prefix = currentLineText[: target_match.start()]
-					converter = WideStringOffsetConverter(prefix)
-					utf16_delta = converter.encodedStringLength
+					utf16_delta = fdm.getUtf16LineOffset(target_match.start())
 					new_abs = lineInfo._startOffset + utf16_delta
-					match_len_utf16 = WideStringOffsetConverter(target_match.group()).encodedStringLength
+					match_len_utf16 = fdm.getUtf16LineOffset(target_match.end()) - utf16_delta
 					lineInfo._startOffset = new_abs
 					lineInfo._endOffset = new_abs + match_len_utf16
 					lineInfo.updateCaret()
-					speech.speak([target_match.group()])
+					speech.speak([matched_text])
 					return
 				else:
 					lineInfo.collapse()
 					lineInfo.move(textInfos.UNIT_CHARACTER, target_match.start())
 					lineInfo.updateCaret()
-					speech.speak([target_match.group()])
+					speech.speak([matched_text])
 					return
 
 		found = False
@@ -417,22 +480,29 @@ class MarkdownEditorOverlay(ScriptableObject):
 			# Note: This assumes it's paired.
 			pass  # Loop below handles it
 
-		while fdm.move(direction) != 0:
+		# Only lines containing a backtick can hold a fence or inline code, so the scan visits just those
+		tickLines = fdm.getMatchLines(patterns.RE_BACKTICK)
+		if direction == 1:
+			candidates = tickLines[bisect.bisect_right(tickLines, fdm.lineIndex) :]
+		else:
+			candidates = reversed(tickLines[: bisect.bisect_left(tickLines, fdm.lineIndex)])
+		isCodeFence = patterns.isCodeFence
+		searchInlineCode = patterns.RE_INLINE_CODE.search
+		for lineIndex in candidates:
+			fdm.lineIndex = lineIndex
 			text = fdm.getText()
 
 			# Check for Code Block Boundary
-			if patterns.RE_CODE_BLOCK.match(text):
+			if isCodeFence(text):
 				if direction == -1:
 					has_info = len(text.strip()) > 3
 					if has_info:  # Found Start Block
 						found = True
 						log.debug("MarkdownNavigator: Found Prev Code Block Start")
 					else:  # Found End Block
-						scanLine = fdm.lineIndex
-						while scanLine > 0:
-							scanLine -= 1  # manual peek
+						for scanLine in reversed(tickLines[: bisect.bisect_left(tickLines, fdm.lineIndex)]):
 							prevText = fdm.getText(scanLine)
-							if patterns.RE_CODE_BLOCK.match(prevText) and len(prevText.strip()) > 3:
+							if isCodeFence(prevText) and len(prevText.strip()) > 3:
 								# Found start
 								fdm.updateCaret(scanLine)  # Move fdm there
 								found = True
@@ -456,28 +526,29 @@ class MarkdownEditorOverlay(ScriptableObject):
 			# Check for Inline Code (only if not skipping block? Legacy checked both)
 			# If we are inside a code block, inline code check might be redundant or noisy.
 			if not should_skip_block:
-				matches = list(patterns.RE_INLINE_CODE.finditer(text))
-				if matches:
+				if direction == 1:
+					m = searchInlineCode(text)
+				else:
+					m = patterns.findMatch(patterns.RE_INLINE_CODE, text, len(text) + 1, -1)
+				if m:
 					found = True
-					m = matches[0] if direction == 1 else matches[-1]
 					log.debug(f"MarkdownNavigator: Found Inline Code at {m.start()}")
 
 					lineInfo = fdm.getTextInfo()
+					matched_text = m.group()
 					if isWeb and isinstance(lineInfo, IA2TextTextInfo):
-						prefix = text[: m.start()]
-						converter = WideStringOffsetConverter(prefix)
-						utf16_delta = converter.encodedStringLength
+						utf16_delta = fdm.getUtf16LineOffset(m.start())
 						new_abs = lineInfo._startOffset + utf16_delta
-						match_len_utf16 = WideStringOffsetConverter(m.group()).encodedStringLength
+						match_len_utf16 = fdm.getUtf16LineOffset(m.end()) - utf16_delta
 						lineInfo._startOffset = new_abs
 						lineInfo._endOffset = new_abs + match_len_utf16
 						lineInfo.updateCaret()
-						speech.speak([m.group()])
+						speech.speak([matched_text])
 					else:
 						lineInfo.collapse()
 						lineInfo.move(textInfos.UNIT_CHARACTER, m.start())
 						lineInfo.updateCaret()
-						speech.speak([m.group()])
+						speech.speak([matched_text])
 					break
 
 		if not found:
@@ -489,55 +560,30 @@ class MarkdownEditorOverlay(ScriptableObject):
 			ui.message(msg)
 
 	def _parse_table_row(self, text):
-		"""
-		Parses a Markdown table row.
-		Returns a list of dicts: {'start': int, 'end': int, 'content_start': int, 'content_end': int, 'text': str}
-		Indices are relative to the start of the line.
-		"""
-		cells = []
-		# Split by pipe, but keep the delimiter to calculate offsets
-		# Regex looks for | not preceded by \
-		pattern = re.compile(r"(?<!\\)\|")
-		matches = list(pattern.finditer(text))
-		if not matches:
-			return []
-		for i in range(len(matches) - 1):
-			start_pipe = matches[i]
-			end_pipe = matches[i + 1]
-			cell_start = start_pipe.end()
-			cell_end = end_pipe.start()
-			cell_text = text[cell_start:cell_end]
-			stripped = cell_text.strip()
-			content_start = cell_start + cell_text.find(stripped) if stripped else cell_start
-			content_end = content_start + len(stripped)
-			cells.append(
-				{
-					"start": cell_start,
-					"end": cell_end,
-					"content_start": content_start,
-					"content_end": content_end,
-					"text": stripped,
-				},
-			)
+		"""Parse a table row with patterns.parseTableRow, reusing the last row's cells for unchanged text."""
+		lastRow = self._lastTableRow
+		if lastRow is not None and lastRow[0] == text:
+			return lastRow[1]
+		cells = patterns.parseTableRow(text)
+		self._lastTableRow = (text, cells)
 		return cells
 
 	def _navigateTable(self, gesture, row_dir, col_dir):
 		if not getattr(self, "markdownBrowseMode", False):
+			self._cachedFdm = None
 			gesture.send()
 			return
 		try:
-			with FastDocumentManager(self) as fdm:
+			with self._documentManager() as fdm:
 				self._navigateTableFast(fdm, row_dir, col_dir)
 		except (RuntimeError, NotImplementedError, LookupError, COMError) as e:
 			log.debugWarning(
 				f"MarkdownNavigator: FastDocumentManager failed for table nav ({e}), falling back to legacy",
 			)
-			from .legacy import navigate_table_legacy
-
-			navigate_table_legacy(self, gesture, row_dir, col_dir)
+			navigate_table_legacy(self, gesture, row_dir, col_dir, self._isWebApp)
 
 	def _navigateTableFast(self, fdm, row_dir, col_dir):
-		isWeb = getattr(self.appModule, "appName", "").lower() in ("chrome", "msedge")
+		isWeb = self._isWebApp
 
 		currentLineText = fdm.getText()
 		if not patterns.RE_TABLE.match(currentLineText):
@@ -581,9 +627,10 @@ class MarkdownEditorOverlay(ScriptableObject):
 
 		# Vertical Move
 		if row_dir != 0:
+			matchTable = patterns.RE_TABLE.match
 			while fdm.move(row_dir) != 0:
 				text = fdm.getText()
-				if not patterns.RE_TABLE.match(text):
+				if not matchTable(text):
 					break
 
 				new_cells = self._parse_table_row(text)
@@ -601,18 +648,13 @@ class MarkdownEditorOverlay(ScriptableObject):
 			return
 
 	def _moveToTableCell(self, fdm, target_cell, isWeb):
-		from textUtils import WideStringOffsetConverter
-
 		target_char_offset = target_cell["content_start"]
 		tiLine = fdm.getTextInfo()
 
 		if isWeb and isinstance(tiLine, IA2TextTextInfo):
 			# Convert to UTF-16 offset
 			# tiLine._startOffset is Global UTF-16 Start of Line
-			text = fdm.getText()
-			prefix = text[:target_char_offset]
-			converter = WideStringOffsetConverter(prefix)
-			target_utf16_offset = converter.encodedStringLength
+			target_utf16_offset = fdm.getUtf16LineOffset(target_char_offset)
 
 			new_abs = tiLine._startOffset + target_utf16_offset
 			tiNew = tiLine.copy()
@@ -642,31 +684,24 @@ class MarkdownEditorOverlay(ScriptableObject):
 	def script_tableRowDown(self, gesture):
 		self._navigateTable(gesture, 1, 0)
 
-	def _find_block_boundary(self, direction, name_start, name_end):
+	def _find_block_boundary(self, direction):
 		if not getattr(self, "markdownBrowseMode", False):
 			return False
 
 		try:
-			with FastDocumentManager(self) as fdm:
+			with self._documentManager() as fdm:
 				currentLineText = fdm.getText()
-				matched_regex = None
-				BLOCK_PATTERNS = [patterns.RE_LIST_ITEM, patterns.RE_TABLE, patterns.RE_BLOCKQUOTE]
-				for regex in BLOCK_PATTERNS:
-					if regex.match(currentLineText):
-						matched_regex = regex
-						break
+				matched_regex = BOUNDARY_BLOCK_PATTERNS.get(patterns.classifyLine(currentLineText))
 
 				if not matched_regex:
 					ui.message(_("Not inside a list, table, or blockquote"))
 					return True
 
-				last_matching_line = fdm.lineIndex
-
-				while fdm.move(direction) != 0:
-					text = fdm.getText()
-					if not matched_regex.match(text):
-						break
-					last_matching_line = fdm.lineIndex
+				# The block's edge is read from the per-document match index rather than matched line by line
+				if direction == 1:
+					last_matching_line = fdm.getBlockEnd(matched_regex, fdm.lineIndex)
+				else:
+					last_matching_line = fdm.getBlockStart(matched_regex, fdm.lineIndex)
 
 				# Move to the last matching line
 				lineInfo = fdm.updateCaret(last_matching_line)
@@ -683,426 +718,101 @@ class MarkdownEditorOverlay(ScriptableObject):
 
 	@script(gesture="kb:,")
 	def script_endOfElement(self, gesture):
-		if not self._find_block_boundary(1, _("start"), _("end")):
+		if not self._find_block_boundary(1):
+			self._cachedFdm = None
 			gesture.send()
 
 	@script(gesture="kb:shift+,")
 	def script_startOfElement(self, gesture):
-		if not self._find_block_boundary(-1, _("start"), _("end")):
+		if not self._find_block_boundary(-1):
+			self._cachedFdm = None
 			gesture.send()
 
+	@script(
+		gestures=[f"kb:{modifier}{key}" for key in ELEMENT_NAVIGATION_KEYS for modifier in ("", "shift+")]
+	)
+	def script_navigateElement(self, gesture):
+		element = ELEMENT_NAVIGATION_KEYS.get(getattr(gesture, "mainKeyName", None))
+		if element is None:
+			# A gesture bound to this script (in a user gesture map, say) for a key that has no element
+			self._cachedFdm = None
+			gesture.send()
+			return
+		regex, name, focus_element, nextNotFound, prevNotFound = element
+		backward = "shift" in gesture.modifierNames
+		self._navigate(
+			gesture,
+			regex,
+			-1 if backward else 1,
+			name,
+			focus_element=focus_element,
+			notFoundMessage=prevNotFound if backward else nextNotFound,
+		)
+
 	# Tables (Explicitly using _navigateBlock)
 	@script(gesture="kb:t")
 	def script_nextTable(self, gesture):
-		self._navigateBlock(gesture, patterns.RE_TABLE, 1, _("table"), notFoundMessage=_("no next table"))
+		self._navigateBlock(gesture, patterns.RE_TABLE, 1, TABLE_NAME, notFoundMessage=NO_NEXT_TABLE)
 
 	@script(gesture="kb:shift+t")
 	def script_prevTable(self, gesture):
-		self._navigateBlock(
-			gesture,
-			patterns.RE_TABLE,
-			-1,
-			_("table"),
-			notFoundMessage=_("no previous table"),
-		)
-
-	# Links & Images (Inline)
-	@script(gesture="kb:k")
-	def script_nextLink(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_LINK,
-			1,
-			_("link"),
-			focus_element=True,
-			notFoundMessage=_("no next link"),
-		)
-
-	@script(gesture="kb:shift+k")
-	def script_prevLink(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_LINK,
-			-1,
-			_("link"),
-			focus_element=True,
-			notFoundMessage=_("no previous link"),
-		)
-
-	@script(gesture="kb:g")
-	def script_nextImage(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_IMAGE,
-			1,
-			_("image"),
-			focus_element=True,
-			notFoundMessage=_("no next graphic"),
-		)
-
-	@script(gesture="kb:shift+g")
-	def script_prevImage(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_IMAGE,
-			-1,
-			_("image"),
-			focus_element=True,
-			notFoundMessage=_("no previous graphic"),
-		)
-
-	@script(gesture="kb:m")
-	def script_nextMathFormula(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_LATEX_MATH,
-			1,
-			# Translators: The element type announced when navigating to a math formula.
-			_("math formula"),
-			focus_element=True,
-			# Translators: Message announced when there is no next math formula to navigate to.
-			notFoundMessage=_("no next math formula"),
-		)
-
-	@script(gesture="kb:shift+m")
-	def script_prevMathFormula(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_LATEX_MATH,
-			-1,
-			# Translators: The element type announced when navigating to a math formula.
-			_("math formula"),
-			focus_element=True,
-			# Translators: Message announced when there is no previous math formula to navigate to.
-			notFoundMessage=_("no previous math formula"),
-		)
-
-	# Block Elements
-	@script(gesture="kb:h")
-	def script_nextHeading(self, gesture):
-		self._navigate(gesture, patterns.RE_HEADING, 1, _("heading"), notFoundMessage=_("no next heading"))
-
-	@script(gesture="kb:shift+h")
-	def script_prevHeading(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_HEADING,
-			-1,
-			_("heading"),
-			notFoundMessage=_("no previous heading"),
-		)
-
-	@script(gesture="kb:i")
-	def script_nextListItem(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_LIST_ITEM,
-			1,
-			_("list item"),
-			notFoundMessage=_("no next list item"),
-		)
-
-	@script(gesture="kb:shift+i")
-	def script_prevListItem(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_LIST_ITEM,
-			-1,
-			_("list item"),
-			notFoundMessage=_("no previous list item"),
-		)
-
-	# Italics (E - Emphasis)
-	@script(gesture="kb:e")
-	def script_nextItalic(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_ITALIC,
-			1,
-			_("italic"),
-			focus_element=True,
-			notFoundMessage=_("no next italic"),
-		)
-
-	@script(gesture="kb:shift+e")
-	def script_prevItalic(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_ITALIC,
-			-1,
-			_("italic"),
-			focus_element=True,
-			notFoundMessage=_("no previous italic"),
-		)
-
-	# Strikethrough (D - Delete)
-	@script(gesture="kb:d")
-	def script_nextStrikethrough(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_STRIKETHROUGH,
-			1,
-			_("strikethrough"),
-			focus_element=True,
-			notFoundMessage=_("no next strikethrough"),
-		)
-
-	@script(gesture="kb:shift+d")
-	def script_prevStrikethrough(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_STRIKETHROUGH,
-			-1,
-			_("strikethrough"),
-			focus_element=True,
-			notFoundMessage=_("no previous strikethrough"),
-		)
-
-	# Bold (B)
-	@script(gesture="kb:b")
-	def script_nextBold(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_BOLD,
-			1,
-			_("bold"),
-			focus_element=True,
-			notFoundMessage=_("no next bold"),
-		)
-
-	@script(gesture="kb:shift+b")
-	def script_prevBold(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_BOLD,
-			-1,
-			_("bold"),
-			focus_element=True,
-			notFoundMessage=_("no previous bold"),
-		)
-
-	# Footnotes (F)
-	@script(gesture="kb:f")
-	def script_nextFootnote(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_FOOTNOTE,
-			1,
-			_("footnote"),
-			focus_element=True,
-			notFoundMessage=_("no next footnote"),
-		)
-
-	@script(gesture="kb:shift+f")
-	def script_prevFootnote(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_FOOTNOTE,
-			-1,
-			_("footnote"),
-			focus_element=True,
-			notFoundMessage=_("no previous footnote"),
-		)
+		self._navigateBlock(gesture, patterns.RE_TABLE, -1, TABLE_NAME, notFoundMessage=NO_PREVIOUS_TABLE)
 
 	@script(gesture="kb:l")
 	def script_nextList(self, gesture):
-		self._navigateBlock(gesture, patterns.RE_LIST_ITEM, 1, _("list"), notFoundMessage=_("no next list"))
+		self._navigateBlock(gesture, patterns.RE_LIST_ITEM, 1, LIST_NAME, notFoundMessage=NO_NEXT_LIST)
 
 	@script(gesture="kb:shift+l")
 	def script_prevList(self, gesture):
-		self._navigateBlock(
-			gesture,
-			patterns.RE_LIST_ITEM,
-			-1,
-			_("list"),
-			notFoundMessage=_("no previous list"),
-		)
+		self._navigateBlock(gesture, patterns.RE_LIST_ITEM, -1, LIST_NAME, notFoundMessage=NO_PREVIOUS_LIST)
 
 	@script(gesture="kb:q")
 	def script_nextBlockquote(self, gesture):
 		self._navigateBlock(
-			gesture,
-			patterns.RE_BLOCKQUOTE,
-			1,
-			_("blockquote"),
-			notFoundMessage=_("no next block quote"),
+			gesture, patterns.RE_BLOCKQUOTE, 1, BLOCKQUOTE_NAME, notFoundMessage=NO_NEXT_BLOCKQUOTE
 		)
 
 	@script(gesture="kb:shift+q")
 	def script_prevBlockquote(self, gesture):
 		self._navigateBlock(
-			gesture,
-			patterns.RE_BLOCKQUOTE,
-			-1,
-			_("blockquote"),
-			notFoundMessage=_("no previous block quote"),
+			gesture, patterns.RE_BLOCKQUOTE, -1, BLOCKQUOTE_NAME, notFoundMessage=NO_PREVIOUS_BLOCKQUOTE
 		)
 
 	@script(gesture="kb:c")
 	def script_nextCodeBlock(self, gesture):
-		self._navigateCode(gesture, 1, _("code"), notFoundMessage=_("no next code"))
+		self._navigateCode(gesture, 1, CODE_NAME, notFoundMessage=NO_NEXT_CODE)
 
 	@script(gesture="kb:shift+c")
 	def script_prevCodeBlock(self, gesture):
-		self._navigateCode(gesture, -1, _("code"), notFoundMessage=_("no previous code"))
-
-	@script(gesture="kb:s")
-	def script_nextSeparator(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_SEPARATOR,
-			1,
-			_("separator"),
-			notFoundMessage=_("no next separator"),
-		)
-
-	@script(gesture="kb:shift+s")
-	def script_prevSeparator(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_SEPARATOR,
-			-1,
-			_("separator"),
-			notFoundMessage=_("no previous separator"),
-		)
-
-	@script(gesture="kb:x")
-	def script_nextCheckbox(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_CHECKBOX,
-			1,
-			_("checkbox"),
-			notFoundMessage=_("no next check box"),
-		)
-
-	@script(gesture="kb:shift+x")
-	def script_prevCheckbox(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.RE_CHECKBOX,
-			-1,
-			_("checkbox"),
-			notFoundMessage=_("no previous check box"),
-		)
+		self._navigateCode(gesture, -1, CODE_NAME, notFoundMessage=NO_PREVIOUS_CODE)
 
 	# Headings Levels
-	@script(gesture="kb:1")
-	def script_nextH1(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.getHeadingRegex(1),
-			1,
-			_("level 1 heading"),
-			notFoundMessage=_("No next heading at level {i}").format(i=1),
-		)
+	def _makeHeadingLevelScripts(level):
+		"""Build the next and previous scripts for one heading level.
 
-	@script(gesture="kb:shift+1")
-	def script_prevH1(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.getHeadingRegex(1),
-			-1,
-			_("level 1 heading"),
-			notFoundMessage=_("No previous heading at level {i}").format(i=1),
-		)
-
-	@script(gesture="kb:2")
-	def script_nextH2(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.getHeadingRegex(2),
-			1,
-			_("level 2 heading"),
-			notFoundMessage=_("No next heading at level {i}").format(i=2),
-		)
-
-	@script(gesture="kb:shift+2")
-	def script_prevH2(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.getHeadingRegex(2),
-			-1,
-			_("level 2 heading"),
-			notFoundMessage=_("No previous heading at level {i}").format(i=2),
-		)
-
-	@script(gesture="kb:3")
-	def script_nextH3(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.getHeadingRegex(3),
-			1,
-			_("level 3 heading"),
-			notFoundMessage=_("No next heading at level {i}").format(i=3),
-		)
-
-	@script(gesture="kb:shift+3")
-	def script_prevH3(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.getHeadingRegex(3),
-			-1,
-			_("level 3 heading"),
-			notFoundMessage=_("No previous heading at level {i}").format(i=3),
-		)
-
-	@script(gesture="kb:4")
-	def script_nextH4(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.getHeadingRegex(4),
-			1,
-			_("level 4 heading"),
-			notFoundMessage=_("No next heading at level {i}").format(i=4),
-		)
-
-	@script(gesture="kb:shift+4")
-	def script_prevH4(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.getHeadingRegex(4),
-			-1,
-			_("level 4 heading"),
-			notFoundMessage=_("No previous heading at level {i}").format(i=4),
-		)
-
-	@script(gesture="kb:5")
-	def script_nextH5(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.getHeadingRegex(5),
-			1,
-			_("level 5 heading"),
-			notFoundMessage=_("No next heading at level {i}").format(i=5),
-		)
-
-	@script(gesture="kb:shift+5")
-	def script_prevH5(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.getHeadingRegex(5),
-			-1,
-			_("level 5 heading"),
-			notFoundMessage=_("No previous heading at level {i}").format(i=5),
-		)
-
-	@script(gesture="kb:6")
-	def script_nextH6(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.getHeadingRegex(6),
-			1,
-			_("level 6 heading"),
-			notFoundMessage=_("No next heading at level {i}").format(i=6),
-		)
-
-	@script(gesture="kb:shift+6")
-	def script_prevH6(self, gesture):
-		self._navigate(
-			gesture,
-			patterns.getHeadingRegex(6),
-			-1,
-			_("level 6 heading"),
-			notFoundMessage=_("No previous heading at level {i}").format(i=6),
-		)
+		Everything the scripts pass to _navigate is bound up front.
+		"""
+		regex = patterns.getHeadingRegex(level)
+		name = HEADING_LEVEL_NAMES[level - 1]
+		nextNotFound = _("No next heading at level {i}").format(i=level)
+		prevNotFound = _("No previous heading at level {i}").format(i=level)
+
+		@script(gesture=f"kb:{level}")
+		def script_next(self, gesture):
+			self._navigate(gesture, regex, 1, name, notFoundMessage=nextNotFound)
+
+		@script(gesture=f"kb:shift+{level}")
+		def script_prev(self, gesture):
+			self._navigate(gesture, regex, -1, name, notFoundMessage=prevNotFound)
+
+		script_next.__name__ = script_next.__qualname__ = f"script_nextH{level}"
+		script_prev.__name__ = script_prev.__qualname__ = f"script_prevH{level}"
+		return script_next, script_prev
+
+	script_nextH1, script_prevH1 = _makeHeadingLevelScripts(1)
+	script_nextH2, script_prevH2 = _makeHeadingLevelScripts(2)
+	script_nextH3, script_prevH3 = _makeHeadingLevelScripts(3)
+	script_nextH4, script_prevH4 = _makeHeadingLevelScripts(4)
+	script_nextH5, script_prevH5 = _makeHeadingLevelScripts(5)
+	script_nextH6, script_prevH6 = _makeHeadingLevelScripts(6)
+	del _makeHeadingLevelScripts
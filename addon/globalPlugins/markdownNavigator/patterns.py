@@ -6,23 +6,158 @@
 import re
 
 # Regex Definitions
-RE_HEADING = re.compile(r"^\s*#{1,6}\s")
-RE_LIST_ITEM = re.compile(r"^\s*([\*\-\+]|\d+\.)\s")
-RE_BLOCKQUOTE = re.compile(r"^\s*>\s")
-RE_TABLE = re.compile(r"^\s*\|")
-RE_CODE_BLOCK = re.compile(r"^\s*`{3,}")
-RE_INLINE_CODE = re.compile(r"(?<!`)`[^`\n]+`(?!`)")
+# Patterns built only from ASCII Markdown syntax use re.ASCII, so \s is a plain ASCII test
+# The captured run of "#" gives the heading level
+RE_HEADING = re.compile(r"^\s*(#{1,6})\s", re.ASCII)
+RE_LIST_ITEM = re.compile(r"^\s*([\*\-\+]|\d+\.)\s", re.ASCII)
+RE_BLOCKQUOTE = re.compile(r"^\s*>\s", re.ASCII)
+RE_TABLE = re.compile(r"^\s*\|", re.ASCII)
+# Cell delimiter: a pipe not escaped with a backslash
+RE_TABLE_PIPE = re.compile(r"(?<!\\)\|")
+RE_CODE_BLOCK = re.compile(r"^\s*`{3,}", re.ASCII)
+RE_INLINE_CODE = re.compile(r"(?<!`)`[^`\n]+`(?!`)", re.ASCII)
+# Any backtick: a line without one holds neither a code fence nor inline code
+RE_BACKTICK = re.compile("`")
 # Non-greedy matching for inline elements
 # Negative lookbehind (?<!!) ensures we don't match images ![...]
 RE_LINK = re.compile(r"(?<!!)\[.+?\]\(.+?\)")
 RE_IMAGE = re.compile(r"!\[.+?\]\(.+?\)")
-RE_SEPARATOR = re.compile(r"^\s*([-*_])\s*\1\s*\1[\-\*_\s]*$")
-RE_CHECKBOX = re.compile(r"^\s*([\*\-\+]|\d+\.)\s*\[[ xX]\]")
-RE_BOLD = re.compile(r"(\*\*|__)(?=\S)(.+?)(?<=\S)\1")
-RE_ITALIC = re.compile(r"(?<!\*)\*(?=[^\s*])(.+?)(?<=[^\s*])\*(?!\*)|(?<!_)_(?=[^\s_])(.+?)(?<=[^\s_])_(?!_)")
-RE_STRIKETHROUGH = re.compile(r"(~~)(?=\S)(.+?)(?<=\S)\1")
+RE_SEPARATOR = re.compile(r"^\s*([-*_])\s*\1\s*\1[\-\*_\s]*$", re.ASCII)
+RE_CHECKBOX = re.compile(r"^\s*([\*\-\+]|\d+\.)\s*\[[ xX]\]", re.ASCII)
+# Emphasis content may not contain its own delimiter run, so a failed opener stops at the next run
+# instead of rescanning the rest of the line: matching stays linear on long lines full of markers
+RE_BOLD = re.compile(r"\*\*(?=\S)(?:[^*\n]|\*(?!\*))+?(?<=\S)\*\*|__(?=\S)(?:[^_\n]|_(?!_))+?(?<=\S)__")
+RE_ITALIC = re.compile(
+	r"(?<!\*)\*(?=[^\s*])(?:[^*\n]|\*\*)+?(?<=[^\s*])\*(?!\*)|(?<!_)_(?=[^\s_])(?:[^_\n]|__)+?(?<=[^\s_])_(?!_)",
+)
+RE_STRIKETHROUGH = re.compile(r"~~(?=\S)(?:[^~\n]|~(?!~))+?(?<=\S)~~")
 RE_FOOTNOTE = re.compile(r"\[\^.+?\](:)?")
 RE_LATEX_MATH = re.compile(r"\$\$[\s\S]*?\$\$|(?<!\$)\$(?!\$)(.+?)(?<!\$)\$(?!\$)")
 
+# The kinds of block the boundary scripts move through, in one anchored alternation, so a line is
+# classified by a single match. Each alternative matches exactly the lines of its RE_* pattern.
+RE_BLOCK_KIND = re.compile(
+	r"^\s*(?:"
+	r"(?P<listItem>(?:[\*\-\+]|\d+\.)\s)"
+	r"|(?P<blockquote>>\s)"
+	r"|(?P<table>\|)"
+	r")",
+	re.ASCII,
+)
+
+
+def classifyLine(text):
+	"""Return "listItem", "blockquote" or "table" for a line that starts such a block, else None."""
+	m = RE_BLOCK_KIND.match(text)
+	return m.lastgroup if m else None
+
+
+def isCodeFence(text):
+	"""Check for a code fence line; the same test as RE_CODE_BLOCK.match, done with string methods."""
+	return text.lstrip(" \t\n\r\f\v").startswith("```")
+
+
+def headingLevel(text):
+	"""Return the level of the heading RE_HEADING matches at the start of text, or 0 if there is none.
+
+	String methods give the same answer as the regex without running the regex engine on every line.
+	"""
+	stripped = text.lstrip(" \t\n\r\f\v")
+	level = len(stripped) - len(stripped.lstrip("#"))
+	if 0 < level <= 6 and level < len(stripped) and stripped[level] in " \t\n\r\f\v":
+		return level
+	return 0
+
+
+# Headings of exactly one level, compiled at import: index 0 holds level 1
+_HEADING_RES = tuple(re.compile(r"^\s*#{%d}\s" % level, re.ASCII) for level in range(1, 7))
+
+
 def getHeadingRegex(level):
-	return re.compile(r"^\s*#{%d}\s" % level)
+	"""Return the precompiled pattern for a heading of exactly this level."""
+	return _HEADING_RES[level - 1]
+
+
+#: Heading level matched by each per-level pattern, so that all levels can be indexed in one pass.
+HEADING_LEVELS = {regex: level for level, regex in enumerate(_HEADING_RES, 1)}
+
+
+#: Text contained in every match of a pattern, on the matched line,
+#: so that lines without it can be skipped by str.find before the pattern is tried.
+LINE_MARKERS = {
+	RE_HEADING: "#",
+	RE_BLOCKQUOTE: ">",
+	RE_TABLE: "|",
+	RE_CODE_BLOCK: "```",
+	RE_BACKTICK: "`",
+	RE_LINK: "](",
+	RE_IMAGE: "![",
+	RE_CHECKBOX: "[",
+	RE_STRIKETHROUGH: "~~",
+	RE_FOOTNOTE: "[^",
+	RE_LATEX_MATH: "$",
+}
+
+
+# Bytes twins of the line patterns that navigate_legacy scans for without focusing the match,
+# the only scan that just needs to know whether a line matches.
+# Lines are encoded as latin-1 with replacement, which keeps one byte per character.
+BYTES_PATTERNS = {
+	pattern: re.compile(pattern.pattern.encode("ascii"))
+	for pattern in (
+		RE_HEADING,
+		RE_LIST_ITEM,
+		RE_SEPARATOR,
+		RE_CHECKBOX,
+		*(getHeadingRegex(level) for level in range(1, 7)),
+	)
+}
+
+
+def findMatch(regex, text, offset, direction):
+	"""Find the first match starting after offset, or the last one starting before it when direction is -1.
+
+	Matches are consumed lazily from finditer, so no list of match objects is built.
+	"""
+	if direction == 1:
+		for m in regex.finditer(text):
+			if m.start() > offset:
+				return m
+		return None
+	target = None
+	for m in regex.finditer(text):
+		if m.start() >= offset:
+			break
+		target = m
+	return target
+
+
+def parseTableRow(text):
+	"""Parse a Markdown table row into a list of cell dictionaries.
+
+	Each cell is {'start': int, 'end': int, 'content_start': int, 'content_end': int, 'text': str},
+	with indices relative to the start of the line.
+	"""
+	if text.count("|") < 2:
+		# A cell needs a pipe on each side; skip the regex for lines that cannot hold one
+		return []
+	cells = []
+	# Consecutive pipe spans bound each cell: one finditer pass, no per-cell searching
+	pipes = [m.span() for m in RE_TABLE_PIPE.finditer(text)]
+	for left, right in zip(pipes, pipes[1:]):
+		cellStart = left[1]
+		cellEnd = right[0]
+		cellText = text[cellStart:cellEnd]
+		stripped = cellText.strip()
+		# Leading whitespace length locates the content without searching for it again
+		contentStart = cellStart + len(cellText) - len(cellText.lstrip()) if stripped else cellStart
+		cells.append(
+			{
+				"start": cellStart,
+				"end": cellEnd,
+				"content_start": contentStart,
+				"content_end": contentStart + len(stripped),
+				"text": stripped,
+			},
+		)
+	return cells